@@ -3,7 +3,7 @@ Health Check API Endpoints
 """
 
 from fastapi import APIRouter
-from datetime import datetime
+from datetime import datetime, timezone
 
 router = APIRouter()
 
@@ -13,7 +13,7 @@ async def health_check():
     """Basic health check endpoint"""
     return {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
         "service": "vibber-ai-agent"
     }
 
@@ -24,7 +24,7 @@ async def readiness_check():
     # In production, this would check DB connections, etc.
     return {
         "ready": True,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
 
@@ -33,5 +33,5 @@ async def liveness_check():
     """Liveness check for Kubernetes"""
     return {
         "alive": True,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": datetime.now(timezone.utc).isoformat()
     }
@@ -47,15 +47,18 @@ class Settings(BaseSettings):
     # Integration credentials (for testing)
     slack_bot_token: str = ""
     github_token: str = ""
+    github_tokens: str = ""  # Comma-separated; requests rotate across them
     jira_api_token: str = ""
 
     # Backend Service Communication
     backend_url: str = "http://localhost:8080"
     internal_service_key: str = "dev-internal-service-key"
+    credentials_cache_ttl: int = 300
 
     # MCP Configuration
     mcp_enabled: bool = True
     mcp_server_timeout: int = 30
+    mcp_max_servers: int = 1024
 
     class Config:
         env_file = ".env"
@@ -8,9 +8,21 @@ import time
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
+import orjson
 import structlog
-from anthropic import AsyncAnthropic
+from anthropic import (
+    APIConnectionError,
+    AsyncAnthropic,
+    InternalServerError,
+    RateLimitError,
+)
 from openai import AsyncOpenAI
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from src.config import settings
 from src.core.personality import PersonalityEngine
@@ -27,6 +39,10 @@ from src.services.mcp_service import MCPService
 
 logger = structlog.get_logger()
 
+# Transient Anthropic failures worth retrying instead of failing the interaction
+RETRYABLE_LLM_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+LLM_MAX_ATTEMPTS = 5
+
 
 class Agent:
     """
@@ -52,7 +68,9 @@ class Agent:
         self.agent_id = agent_id
         self.user_id = user_id
         self.org_id = org_id
-        self.anthropic = anthropic_client
+        # _create_message_with_retry owns retries; stacking the SDK's own
+        # retries on top would multiply attempts per call
+        self.anthropic = anthropic_client.with_options(max_retries=0)
         self.openai = openai_client
         self.embedder = embedder
         self.vector_store = vector_store
@@ -301,7 +319,7 @@ class Agent:
         user_message = self._build_user_message(intent, input_data, context)
 
         # Call Claude
-        response = await self.anthropic.messages.create(
+        response = await self._create_message_with_retry(
             model=self.config.get("model", settings.default_model),
             max_tokens=settings.max_output_tokens,
             system=system_prompt,
@@ -313,6 +331,23 @@ class Agent:
         # Parse structured response if needed
         return self._parse_response(response_text, provider, intent)
 
+    async def _create_message_with_retry(self, **kwargs):
+        """Call the Anthropic messages API, backing off on transient errors"""
+        async for attempt in AsyncRetrying(
+            wait=wait_exponential_jitter(initial=1, max=30),
+            stop=stop_after_attempt(LLM_MAX_ATTEMPTS),
+            retry=retry_if_exception_type(RETRYABLE_LLM_ERRORS),
+            reraise=True,
+        ):
+            with attempt:
+                if attempt.retry_state.attempt_number > 1:
+                    logger.warning(
+                        "Retrying Anthropic request",
+                        agent_id=str(self.agent_id),
+                        attempt=attempt.retry_state.attempt_number
+                    )
+                return await self.anthropic.messages.create(**kwargs)
+
     def _build_system_prompt(self, context: dict, provider: str) -> str:
         """Build system prompt with personality injection"""
         personality = context.get("personality", {})
@@ -390,7 +425,7 @@ IMPORTANT GUIDELINES:
 INTENT: {intent.get('type', 'unknown')} - {intent.get('action', 'respond')}
 
 INPUT DATA:
-{json.dumps(input_data, indent=2)}
+{orjson.dumps(input_data, option=orjson.OPT_INDENT_2).decode()}
 
 """
 
@@ -18,6 +18,8 @@ from src.memory.vector_store import VectorStore
 from src.memory.redis_cache import RedisCache
 from src.services.mcp_service import MCPService
 from src.services.credentials import CredentialsClient
+from src.tools.github import GhClient
+from src.tools.slack import SlackTool
 
 logger = structlog.get_logger()
 
@@ -69,7 +71,8 @@ class AgentManager:
         self.personality_engine = PersonalityEngine(
             self.embedder,
             self.vector_store,
-            self.cache
+            self.cache,
+            anthropic_client=self.anthropic_client
         )
 
         # Initialize credentials client and MCP service
@@ -91,6 +94,10 @@ class AgentManager:
         # Shutdown MCP service
         if self.mcp_service:
             await self.mcp_service.shutdown()
+        if self.credentials_client:
+            await self.credentials_client.aclose()
+        await GhClient.aclose()
+        await SlackTool.aclose()
 
         # Close connections
         if self.cache:
@@ -194,13 +201,13 @@ class AgentManager:
 
         return {"success": True}
 
-    def invalidate_org_credentials(self, org_id: UUID, provider: Optional[str] = None):
+    async def invalidate_org_credentials(self, org_id: UUID, provider: Optional[str] = None):
         """
         Invalidate cached credentials when organization updates their OAuth apps.
         Called by webhook when credentials are changed.
         """
         if self.mcp_service:
-            self.mcp_service.invalidate_server(org_id, provider)
+            await self.mcp_service.invalidate_server(org_id, provider)
             logger.info(
                 "Invalidated credentials for org",
                 org_id=str(org_id),
@@ -37,7 +37,7 @@ class MessageConsumer:
             # Connect to RabbitMQ
             self.connection = await aio_pika.connect_robust(
                 settings.rabbitmq_url,
-                loop=asyncio.get_event_loop()
+                loop=asyncio.get_running_loop()
             )
 
             self.channel = await self.connection.channel()
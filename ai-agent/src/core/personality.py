@@ -34,11 +34,13 @@ class PersonalityEngine:
         embedder: Embedder,
         vector_store: VectorStore,
         cache: RedisCache,
+        anthropic_client: Optional[AsyncAnthropic] = None,
     ):
         self.embedder = embedder
         self.vector_store = vector_store
         self.cache = cache
-        self.anthropic = AsyncAnthropic(api_key=settings.anthropic_api_key)
+        # Reuse the manager's client (and its connection pool) when given
+        self.anthropic = anthropic_client or AsyncAnthropic(api_key=settings.anthropic_api_key)
 
     async def load_profile(self, agent_id: UUID) -> Dict[str, Any]:
         """Load personality profile from cache or generate default"""
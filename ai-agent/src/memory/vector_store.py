@@ -2,11 +2,17 @@
 Vector Store - Manages vector embeddings for semantic search
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 import structlog
 
 from src.config import settings
 
+try:
+    from pinecone import Pinecone
+    _HAS_PINECONE = True
+except ImportError:
+    _HAS_PINECONE = False
+
 logger = structlog.get_logger()
 
 
@@ -20,16 +26,19 @@ class VectorStore:
         self.pinecone_client = None
         self.index = None
         self._in_memory_store: Dict[str, List[Dict]] = {}
-        self._use_pinecone = bool(settings.pinecone_api_key)
+        self._api_key = settings.pinecone_api_key
+        self._index_name = settings.pinecone_index
+        self._use_pinecone = _HAS_PINECONE and bool(self._api_key)
 
     async def initialize(self):
         """Initialize the vector store"""
+        if self._api_key and not _HAS_PINECONE:
+            logger.warning("Pinecone API key set but pinecone client not installed")
+
         if self._use_pinecone:
             try:
-                from pinecone import Pinecone
-
-                self.pinecone_client = Pinecone(api_key=settings.pinecone_api_key)
-                self.index = self.pinecone_client.Index(settings.pinecone_index)
+                self.pinecone_client = Pinecone(api_key=self._api_key)
+                self.index = self.pinecone_client.Index(self._index_name)
 
                 logger.info("Pinecone vector store initialized")
             except Exception as e:
@@ -139,7 +148,7 @@ class VectorStore:
                     {
                         "id": match.id,
                         "score": match.score,
-                        **match.metadata
+                        **(match.metadata or {})
                     }
                     for match in results.matches
                 ]
@@ -150,20 +159,20 @@ class VectorStore:
                 if not vectors:
                     return []
 
+                # Compile the filter once rather than re-parsing it per vector
+                matches = self._compile_filter(filter) if filter else None
+
                 # Calculate similarities
                 scored = []
                 for vector in vectors:
+                    if matches and not matches(vector.get("metadata", {})):
+                        continue
+
                     score = self._cosine_similarity(
                         query_embedding,
                         vector.get("values", [])
                     )
 
-                    # Apply filter if provided
-                    if filter:
-                        metadata = vector.get("metadata", {})
-                        if not self._matches_filter(metadata, filter):
-                            continue
-
                     scored.append({
                         "id": vector["id"],
                         "score": score,
@@ -238,21 +247,67 @@ class VectorStore:
 
     def _matches_filter(self, metadata: Dict, filter: Dict) -> bool:
         """Check if metadata matches filter criteria"""
-        for key, value in filter.items():
-            if key not in metadata:
-                return False
+        return self._compile_filter(filter)(metadata)
+
+    def _compile_filter(self, filter: Dict) -> Callable[[Dict], bool]:
+        """
+        Compile filter criteria into a metadata predicate.
 
+        The filter shape is inspected once so that evaluating a candidate
+        only runs the comparisons it actually needs.
+        """
+        keys = tuple(filter.keys())
+        checks: List[Callable[[Dict], bool]] = []
+
+        for key, value in filter.items():
             if isinstance(value, dict):
                 # Handle operators like $eq, $in, etc.
                 for op, op_value in value.items():
-                    if op == "$eq" and metadata[key] != op_value:
-                        return False
-                    elif op == "$in" and metadata[key] not in op_value:
-                        return False
-                    elif op == "$ne" and metadata[key] == op_value:
-                        return False
+                    if op == "$eq":
+                        checks.append(lambda m, k=key, v=op_value: m[k] == v)
+                    elif op == "$in":
+                        checks.append(self._compile_in(key, op_value))
+                    elif op == "$ne":
+                        checks.append(lambda m, k=key, v=op_value: m[k] != v)
             else:
-                if metadata[key] != value:
+                checks.append(lambda m, k=key, v=value: m[k] == v)
+
+        def predicate(metadata: Dict) -> bool:
+            for key in keys:
+                if key not in metadata:
+                    return False
+            for check in checks:
+                if not check(metadata):
                     return False
+            return True
+
+        return predicate
+
+    @staticmethod
+    def _compile_in(key: str, operand: Any) -> Callable[[Dict], bool]:
+        """
+        Build an $in check. Collections of hashable values are frozen into
+        a set for O(1) lookups; anything else (strings, which keep their
+        substring semantics, or collections holding unhashable items) is
+        tested against the original operand.
+        """
+        if isinstance(operand, (list, tuple, set, frozenset)):
+            try:
+                frozen = frozenset(operand)
+            except TypeError:
+                frozen = None
+        else:
+            frozen = None
+
+        if frozen is None:
+            return lambda m: m[key] in operand
+
+        def check(metadata: Dict) -> bool:
+            value = metadata[key]
+            try:
+                return value in frozen
+            except TypeError:
+                # Unhashable stored value, e.g. a list: compare by equality
+                return value in operand
 
-        return True
+        return check
@@ -2,7 +2,7 @@
 Services module for external integrations
 """
 
-from src.services.credentials import CredentialsClient
+from src.services.credentials import CredentialsClient, CredentialsUnavailableError
 from src.services.mcp_service import MCPService
 
-__all__ = ["CredentialsClient", "MCPService"]
+__all__ = ["CredentialsClient", "CredentialsUnavailableError", "MCPService"]
@@ -2,16 +2,23 @@
 Credentials Client - Fetches OAuth credentials from the backend service
 """
 
-from typing import Dict, Optional
+import asyncio
+import time
+from typing import Dict, Optional, Tuple
 from uuid import UUID
 import httpx
 import structlog
 
 from src.config import settings
+from src.tools.base import SingleFlight
 
 logger = structlog.get_logger()
 
 
+class CredentialsUnavailableError(Exception):
+    """The backend could not be asked, as opposed to having no credentials"""
+
+
 class CredentialsClient:
     """
     Client for fetching organization OAuth credentials from the backend.
@@ -21,72 +28,114 @@ class CredentialsClient:
     def __init__(self):
         self.backend_url = settings.backend_url
         self.service_key = settings.internal_service_key
-        self._cache: Dict[str, Dict] = {}
+        self.cache_ttl = settings.credentials_cache_ttl
+        # cache_key -> (expires_at, credentials), on the monotonic clock
+        self._cache: Dict[str, Tuple[float, Dict]] = {}
+        # In-flight fetches so concurrent misses share one backend request
+        self._inflight = SingleFlight()
+        # Shared pooled client so provider lookups reuse backend connections
+        self._client = httpx.AsyncClient(
+            base_url=self.backend_url,
+            headers={"X-Service-Key": self.service_key},
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=10)
+        )
+
+    async def aclose(self):
+        """Close the underlying HTTP connection pool"""
+        await self._client.aclose()
 
     async def get_credentials(
         self,
         org_id: UUID,
         provider: str,
-        use_cache: bool = True
+        use_cache: bool = True,
+        ttl: Optional[float] = None
     ) -> Optional[Dict]:
         """
         Fetch credentials for a specific organization and provider.
 
+        Concurrent callers that miss the cache for the same key wait on a
+        single backend request instead of each issuing their own.
+
         Args:
             org_id: Organization UUID
             provider: Provider name (slack, github, jira, etc.)
             use_cache: Whether to use cached credentials
+            ttl: Seconds to cache the result (defaults to cache_ttl)
 
         Returns:
             Dictionary containing credentials or None if not found
+
+        Raises:
+            CredentialsUnavailableError: If the backend failed to answer
         """
         cache_key = f"{org_id}:{provider}"
 
-        # Check cache first
-        if use_cache and cache_key in self._cache:
-            logger.debug("Returning cached credentials", org_id=str(org_id), provider=provider)
-            return self._cache[cache_key]
+        if use_cache:
+            # Check cache first
+            cached = self._cache.get(cache_key)
+            if cached and cached[0] > time.monotonic():
+                logger.debug("Returning cached credentials", org_id=str(org_id), provider=provider)
+                return cached[1]
+
+        def store(credentials: Optional[Dict]):
+            if credentials:
+                expires_at = time.monotonic() + (self.cache_ttl if ttl is None else ttl)
+                self._cache[cache_key] = (expires_at, credentials)
+
+        # Concurrent misses for this key share one backend request; an
+        # uncached read still refreshes the cache but joins nothing
+        return await self._inflight.run(
+            cache_key,
+            lambda: self._fetch_credentials(org_id, provider),
+            store=store,
+            join=use_cache
+        )
+
+    async def _fetch_credentials(self, org_id: UUID, provider: str) -> Optional[Dict]:
+        """
+        Request credentials from the backend internal API.
 
+        A 404 means the provider isn't connected and returns None; any
+        other failure raises, so callers don't mistake an outage for it.
+        """
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{self.backend_url}/api/v1/internal/credentials",
-                    params={
-                        "org_id": str(org_id),
-                        "provider": provider
-                    },
-                    headers={
-                        "X-Service-Key": self.service_key
-                    }
+            response = await self._client.get(
+                "/api/v1/internal/credentials",
+                params={
+                    "org_id": str(org_id),
+                    "provider": provider
+                }
+            )
+
+            if response.status_code == 200:
+                credentials = response.json()
+                logger.info(
+                    "Fetched credentials from backend",
+                    org_id=str(org_id),
+                    provider=provider
                 )
+                return credentials
 
-                if response.status_code == 200:
-                    credentials = response.json()
-                    # Cache the credentials
-                    self._cache[cache_key] = credentials
-                    logger.info(
-                        "Fetched credentials from backend",
-                        org_id=str(org_id),
-                        provider=provider
-                    )
-                    return credentials
-
-                elif response.status_code == 404:
-                    logger.warning(
-                        "Credentials not found",
-                        org_id=str(org_id),
-                        provider=provider
-                    )
-                    return None
-
-                else:
-                    logger.error(
-                        "Failed to fetch credentials",
-                        status_code=response.status_code,
-                        org_id=str(org_id),
-                        provider=provider
-                    )
-                    return None
+            elif response.status_code == 404:
+                logger.warning(
+                    "Credentials not found",
+                    org_id=str(org_id),
+                    provider=provider
+                )
+                return None
+
+            else:
+                logger.error(
+                    "Failed to fetch credentials",
+                    status_code=response.status_code,
+                    org_id=str(org_id),
+                    provider=provider
+                )
+                raise CredentialsUnavailableError(
+                    f"Backend returned {response.status_code} for {provider} credentials"
+                )
 
         except httpx.RequestError as e:
             logger.error(
@@ -95,7 +144,7 @@ class CredentialsClient:
                 org_id=str(org_id),
                 provider=provider
             )
-            return None
+            raise CredentialsUnavailableError(str(e)) from e
 
     async def get_all_credentials(self, org_id: UUID) -> Dict[str, Dict]:
         """
@@ -108,14 +157,22 @@ class CredentialsClient:
             Dictionary mapping provider names to credentials
         """
         providers = ["slack", "github", "jira", "confluence", "elastic", "google"]
-        credentials = {}
-
-        for provider in providers:
-            creds = await self.get_credentials(org_id, provider, use_cache=False)
-            if creds:
-                credentials[provider] = creds
 
-        return credentials
+        # Providers are independent, so fetch them concurrently; one
+        # failing provider shouldn't hide the others
+        results = await asyncio.gather(
+            *(
+                self.get_credentials(org_id, provider, use_cache=False)
+                for provider in providers
+            ),
+            return_exceptions=True
+        )
+
+        return {
+            provider: creds
+            for provider, creds in zip(providers, results)
+            if creds and not isinstance(creds, BaseException)
+        }
 
     def clear_cache(self, org_id: Optional[UUID] = None, provider: Optional[str] = None):
         """
@@ -125,17 +182,24 @@ class CredentialsClient:
             org_id: Optional organization ID to clear (clears all if not specified)
             provider: Optional provider to clear
         """
+        # In-flight fetches may have started before the credentials changed,
+        # so new callers must not join them; dropping the entry also stops
+        # the fetch from caching its now-stale result
         if org_id is None:
             self._cache.clear()
+            self._inflight.forget(lambda key: True)
             logger.info("Cleared all cached credentials")
         elif provider is None:
             # Clear all credentials for this org
-            keys_to_remove = [k for k in self._cache.keys() if k.startswith(f"{org_id}:")]
+            prefix = f"{org_id}:"
+            keys_to_remove = [k for k in self._cache.keys() if k.startswith(prefix)]
             for key in keys_to_remove:
                 del self._cache[key]
+            self._inflight.forget(lambda key: key.startswith(prefix))
             logger.info("Cleared cached credentials for org", org_id=str(org_id))
         else:
             cache_key = f"{org_id}:{provider}"
+            self._inflight.forget(lambda key: key == cache_key)
             if cache_key in self._cache:
                 del self._cache[cache_key]
                 logger.info("Cleared cached credentials", org_id=str(org_id), provider=provider)
@@ -148,8 +212,7 @@ class CredentialsClient:
             True if connection is successful
         """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.backend_url}/health")
-                return response.status_code == 200
+            response = await self._client.get("/health", timeout=5.0)
+            return response.status_code == 200
         except httpx.RequestError:
             return False
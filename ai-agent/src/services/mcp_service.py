@@ -3,15 +3,165 @@ MCP Service - Model Context Protocol integration for dynamic tool servers
 """
 
 import asyncio
-from typing import Any, Callable, Dict, List, Optional
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from uuid import UUID
+import httpx
+import orjson
 import structlog
 
 from src.config import settings
-from src.services.credentials import CredentialsClient
+from src.services.credentials import CredentialsClient, CredentialsUnavailableError
 
 logger = structlog.get_logger()
 
+# Tools registered by each provider's MCP server
+PROVIDER_TOOLS: Dict[str, tuple] = {
+    "slack": (
+        "slack_send_message",
+        "slack_get_history",
+        "slack_get_history_batch",
+        "slack_get_user",
+    ),
+    "github": (
+        "github_list_issues",
+        "github_create_issue",
+        "github_comment_issue",
+        "github_list_prs",
+    ),
+    "jira": (
+        "jira_search_issues",
+        "jira_create_issue",
+        "jira_add_comment",
+        "jira_transition_issue",
+    ),
+}
+
+# Concurrent conversations.history calls per batch; the method is Tier 3
+_SLACK_HISTORY_CONCURRENCY = 4
+
+# Tool input schemas, built once per process
+_SLACK_SEND_MESSAGE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "channel": {"type": "string", "description": "Channel ID or name"},
+        "text": {"type": "string", "description": "Message text"},
+        "thread_ts": {"type": "string", "description": "Thread timestamp for replies"}
+    },
+    "required": ["channel", "text"]
+}
+
+_SLACK_GET_HISTORY_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "channel": {"type": "string", "description": "Channel ID"},
+        "limit": {"type": "integer", "description": "Number of messages", "default": 10}
+    },
+    "required": ["channel"]
+}
+
+_SLACK_GET_HISTORY_BATCH_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "channels": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Channel IDs"
+        },
+        "limit": {"type": "integer", "description": "Number of messages per channel", "default": 10}
+    },
+    "required": ["channels"]
+}
+
+_SLACK_GET_USER_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "user_id": {"type": "string", "description": "Slack user ID"}
+    },
+    "required": ["user_id"]
+}
+
+_GITHUB_LIST_ISSUES_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "owner": {"type": "string", "description": "Repository owner"},
+        "repo": {"type": "string", "description": "Repository name"},
+        "state": {"type": "string", "enum": ["open", "closed", "all"], "default": "open"}
+    },
+    "required": ["owner", "repo"]
+}
+
+_GITHUB_CREATE_ISSUE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "owner": {"type": "string", "description": "Repository owner"},
+        "repo": {"type": "string", "description": "Repository name"},
+        "title": {"type": "string", "description": "Issue title"},
+        "body": {"type": "string", "description": "Issue body"}
+    },
+    "required": ["owner", "repo", "title"]
+}
+
+_GITHUB_COMMENT_ISSUE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "owner": {"type": "string", "description": "Repository owner"},
+        "repo": {"type": "string", "description": "Repository name"},
+        "issue_number": {"type": "integer", "description": "Issue number"},
+        "body": {"type": "string", "description": "Comment body"}
+    },
+    "required": ["owner", "repo", "issue_number", "body"]
+}
+
+_GITHUB_LIST_PRS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "owner": {"type": "string", "description": "Repository owner"},
+        "repo": {"type": "string", "description": "Repository name"},
+        "state": {"type": "string", "enum": ["open", "closed", "all"], "default": "open"}
+    },
+    "required": ["owner", "repo"]
+}
+
+_JIRA_SEARCH_ISSUES_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "jql": {"type": "string", "description": "JQL query string"},
+        "max_results": {"type": "integer", "description": "Maximum results", "default": 50}
+    },
+    "required": ["jql"]
+}
+
+_JIRA_CREATE_ISSUE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "project_key": {"type": "string", "description": "Project key"},
+        "summary": {"type": "string", "description": "Issue summary"},
+        "description": {"type": "string", "description": "Issue description"},
+        "issue_type": {"type": "string", "description": "Issue type", "default": "Task"}
+    },
+    "required": ["project_key", "summary"]
+}
+
+_JIRA_ADD_COMMENT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "issue_key": {"type": "string", "description": "Issue key (e.g., PROJ-123)"},
+        "comment": {"type": "string", "description": "Comment text"}
+    },
+    "required": ["issue_key", "comment"]
+}
+
+_JIRA_TRANSITION_ISSUE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "issue_key": {"type": "string", "description": "Issue key (e.g., PROJ-123)"},
+        "transition_id": {"type": "string", "description": "Transition ID"}
+    },
+    "required": ["issue_key", "transition_id"]
+}
+
 
 class MCPTool:
     """Represents an MCP tool with its schema and handler"""
@@ -45,7 +195,15 @@ class MCPServer:
         self.credentials = credentials
         self.org_id = org_id
         self.tools: Dict[str, MCPTool] = {}
+        self._http: Optional[httpx.AsyncClient] = None
+        self._slack_session = None
+        self._tools_cache: List[Dict] = []
+        self._handlers: Dict[str, Callable] = {}
         self._initialized = False
+        # Calls in progress; a dropped server is only closed once idle
+        self._active_calls = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
 
     async def initialize(self):
         """Initialize the MCP server with provider-specific tools"""
@@ -55,12 +213,20 @@ class MCPServer:
         logger.info("Initializing MCP server", provider=self.provider)
 
         # Register provider-specific tools
-        if self.provider == "slack":
-            await self._register_slack_tools()
-        elif self.provider == "github":
-            await self._register_github_tools()
-        elif self.provider == "jira":
-            await self._register_jira_tools()
+        registrar = self._REGISTRARS.get(self.provider)
+        if registrar:
+            await registrar(self)
+
+        # Tool schemas are fixed once registered, so build the listing once
+        self._tools_cache = [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "input_schema": tool.input_schema
+            }
+            for tool in self.tools.values()
+        ]
+        self._handlers = {name: tool.handler for name, tool in self.tools.items()}
 
         self._initialized = True
         logger.info(
@@ -69,55 +235,64 @@ class MCPServer:
             tools=list(self.tools.keys())
         )
 
+    async def close_when_idle(self):
+        """Close once every in-progress tool call has finished"""
+        await self._idle.wait()
+        await self.aclose()
+
+    async def aclose(self):
+        """Release network resources held by this server"""
+        if self._http:
+            await self._http.aclose()
+            self._http = None
+        if self._slack_session:
+            await self._slack_session.close()
+            self._slack_session = None
+
     async def _register_slack_tools(self):
         """Register Slack-specific MCP tools"""
+        import aiohttp
         from slack_sdk.web.async_client import AsyncWebClient
 
-        client = AsyncWebClient(token=self.credentials.get("clientSecret"))
+        # Without an injected session the SDK opens a new one per API call
+        self._slack_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=30)
+        )
+        client = AsyncWebClient(
+            token=self.credentials.get("clientSecret"),
+            session=self._slack_session
+        )
 
         # Send Message tool
         self.tools["slack_send_message"] = MCPTool(
             name="slack_send_message",
             description="Send a message to a Slack channel",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "channel": {"type": "string", "description": "Channel ID or name"},
-                    "text": {"type": "string", "description": "Message text"},
-                    "thread_ts": {"type": "string", "description": "Thread timestamp for replies"}
-                },
-                "required": ["channel", "text"]
-            },
-            handler=lambda params: self._slack_send_message(client, params)
+            input_schema=_SLACK_SEND_MESSAGE_SCHEMA,
+            handler=partial(self._slack_send_message, client)
         )
 
         # Get Channel History tool
         self.tools["slack_get_history"] = MCPTool(
             name="slack_get_history",
             description="Get recent messages from a Slack channel",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "channel": {"type": "string", "description": "Channel ID"},
-                    "limit": {"type": "integer", "description": "Number of messages", "default": 10}
-                },
-                "required": ["channel"]
-            },
-            handler=lambda params: self._slack_get_history(client, params)
+            input_schema=_SLACK_GET_HISTORY_SCHEMA,
+            handler=partial(self._slack_get_history, client)
+        )
+
+        # Get History for several channels tool
+        self.tools["slack_get_history_batch"] = MCPTool(
+            name="slack_get_history_batch",
+            description="Get recent messages from several Slack channels at once",
+            input_schema=_SLACK_GET_HISTORY_BATCH_SCHEMA,
+            handler=partial(self._slack_get_history_batch, client)
         )
 
         # Get User Info tool
         self.tools["slack_get_user"] = MCPTool(
             name="slack_get_user",
             description="Get information about a Slack user",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "user_id": {"type": "string", "description": "Slack user ID"}
-                },
-                "required": ["user_id"]
-            },
-            handler=lambda params: self._slack_get_user(client, params)
+            input_schema=_SLACK_GET_USER_SCHEMA,
+            handler=partial(self._slack_get_user, client)
         )
 
     async def _slack_send_message(self, client, params: Dict) -> Dict:
@@ -143,6 +318,38 @@ class MCPServer:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    async def _slack_get_history_batch(self, client, params: Dict) -> Dict:
+        """Get history for several Slack channels concurrently"""
+        channels = params.get("channels")
+        if not channels:
+            return {"success": False, "error": "No channels specified"}
+        limit = params.get("limit", 10)
+
+        # Bounded fan-out so a long channel list doesn't trip rate limits
+        semaphore = asyncio.Semaphore(_SLACK_HISTORY_CONCURRENCY)
+
+        async def fetch(channel: str):
+            async with semaphore:
+                return await client.conversations_history(channel=channel, limit=limit)
+
+        responses = await asyncio.gather(
+            *(fetch(channel) for channel in channels),
+            return_exceptions=True
+        )
+
+        histories = []
+        errors = []
+        for channel, response in zip(channels, responses):
+            if isinstance(response, BaseException):
+                errors.append({
+                    "channel": channel,
+                    "error": str(response) or type(response).__name__
+                })
+            else:
+                histories.append({"channel": channel, "messages": response["messages"]})
+
+        return {"success": True, "histories": histories, "errors": errors}
+
     async def _slack_get_user(self, client, params: Dict) -> Dict:
         """Get Slack user info"""
         try:
@@ -153,138 +360,108 @@ class MCPServer:
 
     async def _register_github_tools(self):
         """Register GitHub-specific MCP tools"""
-        import httpx
-
         token = self.credentials.get("clientSecret")
-        headers = {
-            "Authorization": f"token {token}",
-            "Accept": "application/vnd.github.v3+json"
-        }
+
+        # Long-lived client so tool calls reuse pooled keep-alive connections
+        self._http = httpx.AsyncClient(
+            base_url="https://api.github.com",
+            headers={
+                "Authorization": f"token {token}",
+                "Accept": "application/vnd.github.v3+json"
+            },
+            timeout=httpx.Timeout(15.0),
+            # Retry failed connects once rather than surfacing the error
+            transport=httpx.AsyncHTTPTransport(
+                retries=1,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=100,
+                    keepalive_expiry=30.0
+                )
+            )
+        )
 
         # List Issues tool
         self.tools["github_list_issues"] = MCPTool(
             name="github_list_issues",
             description="List issues in a GitHub repository",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "owner": {"type": "string", "description": "Repository owner"},
-                    "repo": {"type": "string", "description": "Repository name"},
-                    "state": {"type": "string", "enum": ["open", "closed", "all"], "default": "open"}
-                },
-                "required": ["owner", "repo"]
-            },
-            handler=lambda params: self._github_list_issues(headers, params)
+            input_schema=_GITHUB_LIST_ISSUES_SCHEMA,
+            handler=self._github_list_issues
         )
 
         # Create Issue tool
         self.tools["github_create_issue"] = MCPTool(
             name="github_create_issue",
             description="Create a new issue in a GitHub repository",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "owner": {"type": "string", "description": "Repository owner"},
-                    "repo": {"type": "string", "description": "Repository name"},
-                    "title": {"type": "string", "description": "Issue title"},
-                    "body": {"type": "string", "description": "Issue body"}
-                },
-                "required": ["owner", "repo", "title"]
-            },
-            handler=lambda params: self._github_create_issue(headers, params)
+            input_schema=_GITHUB_CREATE_ISSUE_SCHEMA,
+            handler=self._github_create_issue
         )
 
         # Comment on Issue tool
         self.tools["github_comment_issue"] = MCPTool(
             name="github_comment_issue",
             description="Add a comment to a GitHub issue",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "owner": {"type": "string", "description": "Repository owner"},
-                    "repo": {"type": "string", "description": "Repository name"},
-                    "issue_number": {"type": "integer", "description": "Issue number"},
-                    "body": {"type": "string", "description": "Comment body"}
-                },
-                "required": ["owner", "repo", "issue_number", "body"]
-            },
-            handler=lambda params: self._github_comment_issue(headers, params)
+            input_schema=_GITHUB_COMMENT_ISSUE_SCHEMA,
+            handler=self._github_comment_issue
         )
 
         # List Pull Requests tool
         self.tools["github_list_prs"] = MCPTool(
             name="github_list_prs",
             description="List pull requests in a GitHub repository",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "owner": {"type": "string", "description": "Repository owner"},
-                    "repo": {"type": "string", "description": "Repository name"},
-                    "state": {"type": "string", "enum": ["open", "closed", "all"], "default": "open"}
-                },
-                "required": ["owner", "repo"]
-            },
-            handler=lambda params: self._github_list_prs(headers, params)
+            input_schema=_GITHUB_LIST_PRS_SCHEMA,
+            handler=self._github_list_prs
         )
 
-    async def _github_list_issues(self, headers: Dict, params: Dict) -> Dict:
+    async def _github_list_issues(self, params: Dict) -> Dict:
         """List GitHub issues"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"https://api.github.com/repos/{params['owner']}/{params['repo']}/issues",
-                    headers=headers,
-                    params={"state": params.get("state", "open")}
-                )
-                return {"success": True, "issues": response.json()}
+            response = await self._http.get(
+                f"/repos/{params['owner']}/{params['repo']}/issues",
+                params={"state": params.get("state", "open")}
+            )
+            return {"success": True, "issues": orjson.loads(response.content)}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    async def _github_create_issue(self, headers: Dict, params: Dict) -> Dict:
+    async def _github_create_issue(self, params: Dict) -> Dict:
         """Create a GitHub issue"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"https://api.github.com/repos/{params['owner']}/{params['repo']}/issues",
-                    headers=headers,
-                    json={
-                        "title": params["title"],
-                        "body": params.get("body", "")
-                    }
-                )
-                return {"success": True, "issue": response.json()}
+            response = await self._http.post(
+                f"/repos/{params['owner']}/{params['repo']}/issues",
+                json={
+                    "title": params["title"],
+                    "body": params.get("body", "")
+                }
+            )
+            return {"success": True, "issue": response.json()}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    async def _github_comment_issue(self, headers: Dict, params: Dict) -> Dict:
+    async def _github_comment_issue(self, params: Dict) -> Dict:
         """Comment on a GitHub issue"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"https://api.github.com/repos/{params['owner']}/{params['repo']}/issues/{params['issue_number']}/comments",
-                    headers=headers,
-                    json={"body": params["body"]}
-                )
-                return {"success": True, "comment": response.json()}
+            response = await self._http.post(
+                f"/repos/{params['owner']}/{params['repo']}/issues/{params['issue_number']}/comments",
+                json={"body": params["body"]}
+            )
+            return {"success": True, "comment": response.json()}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    async def _github_list_prs(self, headers: Dict, params: Dict) -> Dict:
+    async def _github_list_prs(self, params: Dict) -> Dict:
         """List GitHub pull requests"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"https://api.github.com/repos/{params['owner']}/{params['repo']}/pulls",
-                    headers=headers,
-                    params={"state": params.get("state", "open")}
-                )
-                return {"success": True, "pull_requests": response.json()}
+            response = await self._http.get(
+                f"/repos/{params['owner']}/{params['repo']}/pulls",
+                params={"state": params.get("state", "open")}
+            )
+            return {"success": True, "pull_requests": orjson.loads(response.content)}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
     async def _register_jira_tools(self):
         """Register Jira-specific MCP tools"""
-        import httpx
         from base64 import b64encode
 
         client_id = self.credentials.get("clientId")
@@ -297,62 +474,32 @@ class MCPServer:
         self.tools["jira_search_issues"] = MCPTool(
             name="jira_search_issues",
             description="Search for Jira issues using JQL",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "jql": {"type": "string", "description": "JQL query string"},
-                    "max_results": {"type": "integer", "description": "Maximum results", "default": 50}
-                },
-                "required": ["jql"]
-            },
-            handler=lambda params: self._jira_search(params)
+            input_schema=_JIRA_SEARCH_ISSUES_SCHEMA,
+            handler=self._jira_search
         )
 
         # Create Issue tool
         self.tools["jira_create_issue"] = MCPTool(
             name="jira_create_issue",
             description="Create a new Jira issue",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "project_key": {"type": "string", "description": "Project key"},
-                    "summary": {"type": "string", "description": "Issue summary"},
-                    "description": {"type": "string", "description": "Issue description"},
-                    "issue_type": {"type": "string", "description": "Issue type", "default": "Task"}
-                },
-                "required": ["project_key", "summary"]
-            },
-            handler=lambda params: self._jira_create_issue(params)
+            input_schema=_JIRA_CREATE_ISSUE_SCHEMA,
+            handler=self._jira_create_issue
         )
 
         # Add Comment tool
         self.tools["jira_add_comment"] = MCPTool(
             name="jira_add_comment",
             description="Add a comment to a Jira issue",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "issue_key": {"type": "string", "description": "Issue key (e.g., PROJ-123)"},
-                    "comment": {"type": "string", "description": "Comment text"}
-                },
-                "required": ["issue_key", "comment"]
-            },
-            handler=lambda params: self._jira_add_comment(params)
+            input_schema=_JIRA_ADD_COMMENT_SCHEMA,
+            handler=self._jira_add_comment
         )
 
         # Transition Issue tool
         self.tools["jira_transition_issue"] = MCPTool(
             name="jira_transition_issue",
             description="Transition a Jira issue to a new status",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "issue_key": {"type": "string", "description": "Issue key (e.g., PROJ-123)"},
-                    "transition_id": {"type": "string", "description": "Transition ID"}
-                },
-                "required": ["issue_key", "transition_id"]
-            },
-            handler=lambda params: self._jira_transition_issue(params)
+            input_schema=_JIRA_TRANSITION_ISSUE_SCHEMA,
+            handler=self._jira_transition_issue
         )
 
     async def _jira_search(self, params: Dict) -> Dict:
@@ -372,29 +519,34 @@ class MCPServer:
         """Transition Jira issue"""
         return {"success": True, "message": "Jira integration requires site URL configuration"}
 
+    # Provider -> tool registration method
+    _REGISTRARS: Dict[str, Callable] = {
+        "slack": _register_slack_tools,
+        "github": _register_github_tools,
+        "jira": _register_jira_tools,
+    }
+
     def list_tools(self) -> List[Dict]:
         """Return list of available tools with their schemas"""
-        return [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "input_schema": tool.input_schema
-            }
-            for tool in self.tools.values()
-        ]
+        return self._tools_cache
 
     async def call_tool(self, name: str, arguments: Dict) -> Dict:
         """Execute an MCP tool"""
-        if name not in self.tools:
+        handler = self._handlers.get(name)
+        if handler is None:
             return {"error": f"Tool '{name}' not found"}
 
-        tool = self.tools[name]
+        self._active_calls += 1
+        self._idle.clear()
         try:
-            result = await tool.handler(arguments)
-            return result
+            return await handler(arguments)
         except Exception as e:
             logger.error("Tool execution failed", tool=name, error=str(e))
             return {"error": str(e)}
+        finally:
+            self._active_calls -= 1
+            if not self._active_calls:
+                self._idle.set()
 
 
 class MCPService:
@@ -403,10 +555,21 @@ class MCPService:
     Dynamically creates and manages MCP server instances based on credentials.
     """
 
+    _TOOL_TO_PROVIDER: Dict[str, str] = {
+        tool: provider
+        for provider, tools in PROVIDER_TOOLS.items()
+        for tool in tools
+    }
+
     def __init__(self, credentials_client: Optional[CredentialsClient] = None):
         self.credentials_client = credentials_client or CredentialsClient()
-        self._servers: Dict[str, MCPServer] = {}
-        self._lock = asyncio.Lock()
+        # Servers in least-recently-used order, bounded by max_servers
+        # Keyed by (org_id, provider); UUIDs hash without being formatted
+        self._servers: "OrderedDict[Tuple[UUID, str], MCPServer]" = OrderedDict()
+        self.max_servers = settings.mcp_max_servers
+        self._tools_by_org: Dict[UUID, List[Dict]] = {}
+        # Pending closes of evicted servers, referenced so they aren't GC'd
+        self._closing: Set[asyncio.Task] = set()
 
     async def get_server(self, org_id: UUID, provider: str) -> Optional[MCPServer]:
         """
@@ -418,30 +581,67 @@ class MCPService:
 
         Returns:
             MCPServer instance or None if credentials not found
+
+        Raises:
+            CredentialsUnavailableError: If the credentials backend failed
         """
-        server_key = f"{org_id}:{provider}"
+        server_key = (org_id, provider)
 
-        async with self._lock:
-            # Return existing server if available
-            if server_key in self._servers:
-                return self._servers[server_key]
+        # Fast path: server already exists
+        server = self._servers.get(server_key)
+        if server:
+            self._servers.move_to_end(server_key)
+            return server
 
-            # Fetch credentials
-            credentials = await self.credentials_client.get_credentials(org_id, provider)
-            if not credentials:
-                logger.warning(
-                    "No credentials found for MCP server",
-                    org_id=str(org_id),
-                    provider=provider
-                )
-                return None
+        return await self._ensure_server(server_key, org_id, provider)
 
-            # Create and initialize new server
-            server = MCPServer(provider, credentials, org_id)
-            await server.initialize()
+    async def _ensure_server(
+        self,
+        server_key: Tuple[UUID, str],
+        org_id: UUID,
+        provider: str
+    ) -> Optional[MCPServer]:
+        """
+        Create and install a server without holding anything across I/O.
 
-            self._servers[server_key] = server
-            return server
+        Credential fetches are coalesced by the credentials client, so the
+        only cost of a race is a duplicate initialize; the loser is closed.
+        """
+        credentials = await self.credentials_client.get_credentials(org_id, provider)
+        if not credentials:
+            logger.warning(
+                "No credentials found for MCP server",
+                org_id=str(org_id),
+                provider=provider
+            )
+            return None
+
+        # Create and initialize new server
+        server = MCPServer(provider, credentials, org_id)
+        await server.initialize()
+
+        # Installation doesn't await, so it is atomic on the event loop
+        existing = self._servers.get(server_key)
+        if existing:
+            await server.aclose()
+            return existing
+
+        self._servers[server_key] = server
+        self._evict_idle_servers()
+        return server
+
+    def _evict_idle_servers(self):
+        """Close least-recently-used servers beyond max_servers"""
+        while len(self._servers) > self.max_servers:
+            (org_id, provider), server = self._servers.popitem(last=False)
+            self._close_when_idle(server)
+            logger.info("Evicted idle MCP server", org_id=str(org_id), provider=provider)
+
+    def _close_when_idle(self, server: MCPServer):
+        """Schedule a dropped server to close once its in-flight calls finish"""
+        task = asyncio.create_task(server.close_when_idle())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
 
     async def get_available_tools(self, org_id: UUID) -> List[Dict]:
         """
@@ -453,14 +653,36 @@ class MCPService:
         Returns:
             List of tool definitions
         """
+        cached = self._tools_by_org.get(org_id)
+        if cached is not None:
+            return cached
+
         tools = []
-        providers = ["slack", "github", "jira"]
+        providers = list(PROVIDER_TOOLS)
+        complete = True
 
-        for provider in providers:
-            server = await self.get_server(org_id, provider)
-            if server:
+        servers = await asyncio.gather(
+            *(self.get_server(org_id, provider) for provider in providers),
+            return_exceptions=True
+        )
+
+        for provider, server in zip(providers, servers):
+            if isinstance(server, BaseException):
+                complete = False
+                logger.warning(
+                    "Failed to load MCP server",
+                    org_id=str(org_id),
+                    provider=provider,
+                    error=str(server)
+                )
+            elif server:
                 tools.extend(server.list_tools())
 
+        # Only pin the catalogue when every provider either loaded or has
+        # no credentials; a backend failure raises and is retried next call
+        if complete:
+            self._tools_by_org[org_id] = tools
+
         return tools
 
     async def execute_tool(
@@ -481,15 +703,46 @@ class MCPService:
             Tool execution result
         """
         # Determine provider from tool name
-        provider = tool_name.split("_")[0]
+        provider = self._TOOL_TO_PROVIDER.get(tool_name) or tool_name.split("_", 1)[0]
 
-        server = await self.get_server(org_id, provider)
+        try:
+            server = await self.get_server(org_id, provider)
+        except CredentialsUnavailableError as e:
+            return {"error": f"Credentials unavailable for provider {provider}: {e}"}
         if not server:
             return {"error": f"No MCP server available for provider: {provider}"}
 
         return await server.call_tool(tool_name, arguments)
 
-    def invalidate_server(self, org_id: UUID, provider: Optional[str] = None):
+    async def execute_tools(
+        self,
+        org_id: UUID,
+        calls: List[Dict[str, Any]]
+    ) -> List[Dict]:
+        """
+        Execute several MCP tools concurrently.
+
+        Args:
+            org_id: Organization UUID
+            calls: List of dicts with 'name' and optional 'arguments'
+
+        Returns:
+            Tool execution results, in the same order as calls
+        """
+        results = await asyncio.gather(
+            *(
+                self.execute_tool(org_id, call["name"], call.get("arguments", {}))
+                for call in calls
+            ),
+            return_exceptions=True
+        )
+
+        return [
+            {"error": str(result)} if isinstance(result, BaseException) else result
+            for result in results
+        ]
+
+    async def invalidate_server(self, org_id: UUID, provider: Optional[str] = None):
         """
         Invalidate cached MCP servers when credentials change.
 
@@ -497,22 +750,37 @@ class MCPService:
             org_id: Organization UUID
             provider: Optional specific provider to invalidate
         """
+        removed: List[MCPServer] = []
+
         if provider:
-            server_key = f"{org_id}:{provider}"
-            if server_key in self._servers:
-                del self._servers[server_key]
+            server = self._servers.pop((org_id, provider), None)
+            if server:
+                removed.append(server)
                 logger.info("Invalidated MCP server", org_id=str(org_id), provider=provider)
         else:
             # Invalidate all servers for this org
-            keys_to_remove = [k for k in self._servers.keys() if k.startswith(f"{org_id}:")]
+            keys_to_remove = [k for k in self._servers if k[0] == org_id]
             for key in keys_to_remove:
-                del self._servers[key]
+                removed.append(self._servers.pop(key))
             logger.info("Invalidated all MCP servers for org", org_id=str(org_id))
 
+        self._tools_by_org.pop(org_id, None)
+
         # Also clear credentials cache
         self.credentials_client.clear_cache(org_id, provider)
 
+        # Servers are already unreachable, but may still be serving calls
+        # handed out earlier; release their connections once those finish
+        for server in removed:
+            self._close_when_idle(server)
+
     async def shutdown(self):
         """Cleanup all MCP servers"""
+        await asyncio.gather(
+            *(server.aclose() for server in self._servers.values()),
+            *self._closing,
+            return_exceptions=True
+        )
         self._servers.clear()
+        self._tools_by_org.clear()
         logger.info("MCP service shutdown complete")
@@ -2,13 +2,132 @@
 Base Tool Classes - Foundation for integration tools
 """
 
+import asyncio
+import hashlib
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, ClassVar, Dict, Hashable, List, Mapping, Optional, Tuple
 import structlog
 
 logger = structlog.get_logger()
 
 
+def token_digest(token: str) -> str:
+    """Key for caching per-token state without keeping the token itself"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class TTLCache:
+    """
+    Small LRU cache whose entries expire after a fixed number of seconds,
+    unless set() is given a ttl for that entry.
+
+    Used by tools to avoid refetching the same PR or issue several times
+    while a single webhook is being classified, scored and acted on.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (expires_at, value), on the monotonic clock
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store a value, evicting the least recently used entry if full"""
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def discard(self, key: Hashable):
+        """Drop a single entry, e.g. after the underlying object changed"""
+        self._data.pop(key, None)
+
+    def clear(self):
+        """Drop all cached entries"""
+        self._data.clear()
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into one.
+
+    The first caller for a key runs the fetch; callers arriving while it
+    is in flight wait on its result instead of fetching again. Joiners are
+    shielded from the owner's cancellation and start their own fetch.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        store: Optional[Callable[[Any], None]] = None,
+        join: bool = True
+    ) -> Any:
+        """
+        Return fetch()'s result for key, sharing an in-flight call if any.
+
+        Args:
+            key: Identifies calls that can share a result
+            fetch: Makes the underlying call
+            store: Called with the result, unless the flight was forgotten
+                meanwhile, e.g. to fill a cache
+            join: Whether to join an in-flight call rather than start one
+        """
+        while join:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Only the owner was cancelled: fetch again ourselves
+                if not inflight.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+
+        try:
+            result = await fetch()
+            if store is not None and self._inflight.get(key) is future:
+                store(result)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else is waiting
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def forget(self, predicate: Callable[[Hashable], bool]):
+        """
+        Detach in-flight calls whose key matches, e.g. after the underlying
+        data changed: later callers start afresh, and results aren't stored.
+        """
+        for key in [key for key in self._inflight if predicate(key)]:
+            del self._inflight[key]
+
+
 class BaseTool(ABC):
     """
     Base class for all integration tools.
@@ -20,6 +139,11 @@ class BaseTool(ABC):
     name: str = "base"
     description: str = "Base tool"
 
+    # Seconds a successful credential check is trusted for
+    validation_ttl: ClassVar[float] = 300
+    # Digests of tool name + secrets that passed, shared across instances
+    _validated: ClassVar[TTLCache] = TTLCache(maxsize=4096, ttl=validation_ttl)
+
     @abstractmethod
     async def execute(
         self,
@@ -57,6 +181,90 @@ class BaseTool(ABC):
         """Return list of actions this tool can perform"""
         return []
 
+    def _validation_key(self, *secrets: str) -> str:
+        """Cache key for a credential check that doesn't keep the secret"""
+        return token_digest("\0".join((self.name, *secrets)))
+
+    def _recently_validated(self, *secrets: str) -> bool:
+        """Whether these credentials passed validation within validation_ttl"""
+        return self._validated.get(self._validation_key(*secrets)) is not None
+
+    def _mark_validated(self, *secrets: str):
+        """Remember that these credentials passed validation"""
+        self._validated.set(self._validation_key(*secrets), True, ttl=self.validation_ttl)
+
+
+class RateLimiter:
+    """
+    Paces requests against an API that reports its remaining quota.
+
+    Tracks the X-RateLimit-Remaining / X-RateLimit-Reset response headers
+    and, once the remaining budget drops below threshold, spreads the
+    requests left evenly over the time until the window resets. Each
+    acquire reserves its own send slot, so concurrent callers are
+    staggered rather than all waking after the same delay.
+    """
+
+    def __init__(self, threshold: int = 100):
+        self.threshold = threshold
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_epoch: float = 0.0
+        self._next_slot: float = 0.0
+
+    def is_low(self, fraction: float = 0.1) -> bool:
+        """Whether less than fraction of the window's quota is left"""
+        if self.remaining is None or not self.limit:
+            return False
+        return self.remaining < self.limit * fraction
+
+    async def acquire(self):
+        """Wait as long as needed before issuing the next request"""
+        if self.remaining is None or self.remaining >= self.threshold:
+            return
+
+        # Reserve the slot and spend one request before yielding, so the
+        # next caller sees both and queues up behind this one
+        now = time.time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + max(self.reset_epoch - slot, 0) / max(self.remaining, 1)
+        self.remaining = max(self.remaining - 1, 0)
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def update(self, headers: Mapping[str, str]):
+        """Record the quota reported by a response"""
+        limit = headers.get("x-ratelimit-limit")
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+        if limit is not None:
+            self.limit = int(limit)
+        if remaining is not None:
+            self.remaining = int(remaining)
+        if reset is not None:
+            self.reset_epoch = float(reset)
+
+
+async def gather_steps(steps: Dict[str, Awaitable[Any]]) -> Dict[str, Any]:
+    """
+    Run named steps concurrently and summarise which ones failed.
+
+    Used by multi-step actions such as triage, where one failed update
+    should be reported rather than abort the others.
+    """
+    results = await asyncio.gather(*steps.values(), return_exceptions=True)
+    errors = {
+        name: str(result) or type(result).__name__
+        for name, result in zip(steps, results)
+        if isinstance(result, BaseException)
+    }
+    return {
+        "success": not errors,
+        "applied": [name for name in steps if name not in errors],
+        "errors": errors
+    }
+
 
 class ToolRegistry:
     """
@@ -69,7 +277,7 @@ class ToolRegistry:
     def register(self, tool: BaseTool):
         """Register a tool"""
         self._tools[tool.name] = tool
-        logger.debug(f"Registered tool: {tool.name}")
+        logger.debug("Registered tool", tool=tool.name)
 
     def get(self, name: str) -> Optional[BaseTool]:
         """Get a tool by name"""
@@ -2,16 +2,256 @@
 GitHub Tool - Handles GitHub interactions
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import itertools
+import random
+import re
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, Optional, Sequence
+import httpx
+import orjson
 import structlog
-from github import Github, GithubException
-from github.PullRequest import PullRequest
 
 from src.config import settings
-from src.tools.base import BaseTool
+from src.tools.base import BaseTool, RateLimiter, SingleFlight, TTLCache, gather_steps, token_digest
 
 logger = structlog.get_logger()
 
+# Matches the page number of the rel="last" entry in a Link header
+_LAST_PAGE_RE = re.compile(r'[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+# Larger bodies (mostly PR diffs) aren't kept for ETag revalidation
+_ETAG_CACHE_MAX_BODY = 256 * 1024
+
+
+class GhClient:
+    """
+    Minimal async client for the GitHub REST API.
+
+    All instances share one pooled connection to api.github.com; the token
+    is sent per request so tools for different installations can share it.
+    Given several tokens, reads (GET) rotate across them so the effective
+    hourly read quota scales with the number of tokens. Writes always use
+    the primary token, tokens[0], so comments and reviews are authored by
+    one identity even when the tokens belong to different accounts.
+    """
+
+    base_url = "https://api.github.com"
+    max_retries = 5
+    max_backoff = 60.0
+
+    _http: ClassVar[Optional[httpx.AsyncClient]] = None
+    # Quota is per token, so limiters are shared by every client using it.
+    # Keyed by token digest and bounded; quota windows reset hourly anyway
+    _shared_limiters: ClassVar[TTLCache] = TTLCache(maxsize=1024, ttl=3600)
+
+    def __init__(self, tokens: Sequence[str]):
+        self.tokens = list(tokens)
+        self._rotation = itertools.cycle(self.tokens)
+        # (path, params, accept) -> (token, last 200 response); revalidated
+        # via its ETag under the same token, since responses vary by token
+        self._etag_cache = TTLCache(maxsize=64, ttl=3600)
+        self._limiters = {token: self._shared_limiter(token) for token in self.tokens}
+
+    @classmethod
+    def _shared_limiter(cls, token: str) -> RateLimiter:
+        """Return the rate limiter tracking a token's quota"""
+        key = token_digest(token)
+        limiter = cls._shared_limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter()
+            cls._shared_limiters.set(key, limiter)
+        return limiter
+
+    def _next_token(self, method: str) -> str:
+        """
+        Pick the token for a request: writes are pinned to the primary
+        token; reads take the next one in rotation, skipping nearly
+        exhausted ones.
+        """
+        if method != "GET":
+            return self.tokens[0]
+        for _ in range(len(self.tokens)):
+            token = next(self._rotation)
+            if not self._limiters[token].is_low():
+                return token
+        return token
+
+    @classmethod
+    def _client(cls) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use"""
+        if cls._http is None or cls._http.is_closed:
+            cls._http = httpx.AsyncClient(
+                base_url=cls.base_url,
+                headers={"Accept": "application/vnd.github+json"},
+                timeout=15.0,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=100
+                )
+            )
+        return cls._http
+
+    @classmethod
+    async def check_token(cls, token: str):
+        """
+        Authenticate a token with a single request, raising
+        httpx.HTTPStatusError if GitHub rejects it. Unlike request(), there
+        are no retries and nothing is kept for the token afterwards.
+        """
+        # /rate_limit authenticates the token without spending quota
+        response = await cls._client().get(
+            "/rate_limit",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+
+    @classmethod
+    async def aclose(cls):
+        """Close the shared connection pool"""
+        if cls._http is not None:
+            await cls._http.aclose()
+            cls._http = None
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        pin_token: Optional[str] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Send a request, raising httpx.HTTPStatusError on error responses.
+
+        Requests are paced by the token's rate limiter, and rate-limited
+        responses are retried with exponential backoff. Only GETs rotate
+        tokens; other methods always go out as the primary token. Passing
+        pin_token sends every attempt with that token instead.
+        """
+        extra_headers = kwargs.pop("headers", {})
+
+        for attempt in range(self.max_retries + 1):
+            token = pin_token or self._next_token(method)
+            limiter = self._limiters[token]
+            headers = {"Authorization": f"Bearer {token}", **extra_headers}
+
+            await limiter.acquire()
+            response = await self._client().request(method, path, headers=headers, **kwargs)
+            limiter.update(response.headers)
+
+            if attempt == self.max_retries or not self._is_rate_limited(response):
+                break
+
+            delay = self._backoff_delay(response, attempt)
+            logger.warning(
+                "GitHub rate limit hit, backing off",
+                path=path,
+                status_code=response.status_code,
+                delay=delay
+            )
+            await asyncio.sleep(delay)
+
+        if response.status_code != httpx.codes.NOT_MODIFIED:
+            response.raise_for_status()
+        return response
+
+    @staticmethod
+    def _is_rate_limited(response: httpx.Response) -> bool:
+        """GitHub signals rate limiting with 429, or 403 and an empty quota"""
+        if response.status_code == 429:
+            return True
+        return (
+            response.status_code == 403
+            and (
+                response.headers.get("x-ratelimit-remaining") == "0"
+                or "retry-after" in response.headers
+            )
+        )
+
+    def _backoff_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Honour Retry-After, otherwise back off exponentially with jitter"""
+        retry_after = response.headers.get("retry-after")
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.max_backoff)
+        return min(2 ** attempt + random.uniform(0, 1), self.max_backoff)
+
+    async def get_response(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        accept: Optional[str] = None
+    ) -> httpx.Response:
+        """
+        Conditional GET: repeat reads send If-None-Match with the stored
+        ETag, and a 304 returns the stored response. GitHub doesn't count
+        304s against the rate limit. accept overrides the media type, and
+        is part of the cache key since each representation has its own ETag.
+
+        ETags differ per token, so a revalidation is pinned to the token
+        that fetched the stored response, unless that token is running low.
+        """
+        cache_key = (path, tuple(sorted((params or {}).items())), accept)
+        cached = self._etag_cache.get(cache_key)
+        if cached and self._limiters[cached[0]].is_low():
+            cached = None
+
+        headers = {"If-None-Match": cached[1].headers["etag"]} if cached else {}
+        if accept:
+            headers["Accept"] = accept
+
+        response = await self.request(
+            "GET",
+            path,
+            pin_token=cached[0] if cached else None,
+            params=params,
+            headers=headers
+        )
+        if response.status_code == httpx.codes.NOT_MODIFIED and cached:
+            return cached[1]
+
+        if "etag" in response.headers and len(response.content) <= _ETAG_CACHE_MAX_BODY:
+            # The token request() used, which a revalidation must reuse
+            token = response.request.headers["authorization"].removeprefix("Bearer ")
+            self._etag_cache.set(cache_key, (token, response))
+        return response
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET a resource and return the decoded JSON body"""
+        response = await self.get_response(path, params)
+        return orjson.loads(response.content)
+
+    async def get_all_pages(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        per_page: int = 100
+    ) -> List[Any]:
+        """
+        GET every page of a list endpoint.
+
+        The first response's Link header gives the last page number, so
+        the remaining pages are requested concurrently rather than in turn.
+        """
+        params = {**(params or {}), "per_page": per_page}
+        first = await self.get_response(path, {**params, "page": 1})
+        items = orjson.loads(first.content)
+
+        match = _LAST_PAGE_RE.search(first.headers.get("link", ""))
+        if match:
+            last_page = int(match.group(1))
+            pages = await asyncio.gather(*(
+                self.get(path, params={**params, "page": page})
+                for page in range(2, last_page + 1)
+            ))
+            for page_items in pages:
+                items.extend(page_items)
+
+        return items
+
+    async def post(self, path: str, json: Any) -> Any:
+        """POST a JSON payload and return the decoded JSON body"""
+        response = await self.request("POST", path, json=json)
+        return orjson.loads(response.content)
+
 
 class GitHubTool(BaseTool):
     """
@@ -28,9 +268,24 @@ class GitHubTool(BaseTool):
     name = "github"
     description = "Interact with GitHub repositories"
 
-    def __init__(self, token: Optional[str] = None):
-        self.token = token or settings.github_token
-        self.client = Github(self.token) if self.token else None
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        tokens: Optional[List[str]] = None
+    ):
+        if token:
+            self.tokens = [token]
+        elif tokens:
+            self.tokens = list(tokens)
+        else:
+            configured = [t.strip() for t in settings.github_tokens.split(",")]
+            self.tokens = [t for t in configured if t] or (
+                [settings.github_token] if settings.github_token else []
+            )
+        self.client = GhClient(self.tokens) if self.tokens else None
+        self._diff_cache = TTLCache(maxsize=512, ttl=60)
+        # In-flight diff fetches so concurrent callers share one request
+        self._inflight_diffs = SingleFlight()
 
     async def execute(
         self,
@@ -43,33 +298,18 @@ class GitHubTool(BaseTool):
             return {"success": False, "error": "GitHub client not configured"}
 
         try:
-            if action == "comment":
-                return await self._add_comment(input_data, response_text)
-
-            elif action == "review_code":
-                return await self._review_pr(input_data, response_text)
-
-            elif action == "approve":
-                return await self._approve_pr(input_data, response_text)
-
-            elif action == "request_changes":
-                return await self._request_changes(input_data, response_text)
-
-            elif action == "triage":
-                return await self._triage_issue(input_data, response_text)
-
-            elif action == "add_label":
-                return await self._add_label(input_data, response_text)
-
-            else:
+            handler = self._ACTIONS.get(action)
+            if handler is None:
                 return {"success": False, "error": f"Unknown action: {action}"}
 
-        except GithubException as e:
-            logger.error(f"GitHub API error: {e}")
+            return await handler(self, input_data, response_text)
+
+        except httpx.HTTPStatusError as e:
+            logger.error("GitHub API error", action=action, error=str(e))
             return {"success": False, "error": str(e)}
 
         except Exception as e:
-            logger.error(f"GitHub tool error: {e}")
+            logger.error("GitHub tool error", action=action, error=str(e))
             return {"success": False, "error": str(e)}
 
     async def _add_comment(
@@ -82,24 +322,19 @@ class GitHubTool(BaseTool):
         if not repo_name:
             return {"success": False, "error": "Repository not specified"}
 
-        repo = self.client.get_repo(repo_name)
-
-        # Check if it's a PR or issue
-        if "pull_request" in input_data:
-            pr_number = input_data["pull_request"]["number"]
-            pr = repo.get_pull(pr_number)
-            comment = pr.create_issue_comment(text)
-        elif "issue" in input_data:
-            issue_number = input_data["issue"]["number"]
-            issue = repo.get_issue(issue_number)
-            comment = issue.create_comment(text)
-        else:
+        number = self._get_item_number(input_data)
+        if not number:
             return {"success": False, "error": "No PR or issue in input"}
 
+        comment = await self.client.post(
+            f"/repos/{repo_name}/issues/{number}/comments",
+            json={"body": text}
+        )
+
         return {
             "success": True,
-            "comment_id": comment.id,
-            "comment_url": comment.html_url
+            "comment_id": comment["id"],
+            "comment_url": comment["html_url"]
         }
 
     async def _review_pr(
@@ -108,26 +343,8 @@ class GitHubTool(BaseTool):
         review_body: str
     ) -> Dict[str, Any]:
         """Submit a code review on a PR"""
-        repo_name = self._get_repo_name(input_data)
-        if not repo_name:
-            return {"success": False, "error": "Repository not specified"}
-
-        repo = self.client.get_repo(repo_name)
-        pr_number = input_data.get("pull_request", {}).get("number")
-
-        if not pr_number:
-            return {"success": False, "error": "PR number not found"}
-
-        pr = repo.get_pull(pr_number)
-
-        # Create a review with COMMENT event (doesn't approve or request changes)
-        review = pr.create_review(body=review_body, event="COMMENT")
-
-        return {
-            "success": True,
-            "review_id": review.id,
-            "state": review.state
-        }
+        # COMMENT event doesn't approve or request changes
+        return await self._submit_review(input_data, review_body, "COMMENT")
 
     async def _approve_pr(
         self,
@@ -135,24 +352,10 @@ class GitHubTool(BaseTool):
         comment: str
     ) -> Dict[str, Any]:
         """Approve a pull request"""
-        repo_name = self._get_repo_name(input_data)
-        if not repo_name:
-            return {"success": False, "error": "Repository not specified"}
-
-        repo = self.client.get_repo(repo_name)
-        pr_number = input_data.get("pull_request", {}).get("number")
-
-        if not pr_number:
-            return {"success": False, "error": "PR number not found"}
-
-        pr = repo.get_pull(pr_number)
-        review = pr.create_review(body=comment, event="APPROVE")
-
-        return {
-            "success": True,
-            "review_id": review.id,
-            "state": "APPROVED"
-        }
+        result = await self._submit_review(input_data, comment, "APPROVE")
+        if result["success"]:
+            result["state"] = "APPROVED"
+        return result
 
     async def _request_changes(
         self,
@@ -160,23 +363,36 @@ class GitHubTool(BaseTool):
         comment: str
     ) -> Dict[str, Any]:
         """Request changes on a pull request"""
+        result = await self._submit_review(input_data, comment, "REQUEST_CHANGES")
+        if result["success"]:
+            result["state"] = "CHANGES_REQUESTED"
+        return result
+
+    async def _submit_review(
+        self,
+        input_data: Dict[str, Any],
+        body: str,
+        event: str
+    ) -> Dict[str, Any]:
+        """Create a PR review with a single POST to the reviews endpoint"""
         repo_name = self._get_repo_name(input_data)
         if not repo_name:
             return {"success": False, "error": "Repository not specified"}
 
-        repo = self.client.get_repo(repo_name)
         pr_number = input_data.get("pull_request", {}).get("number")
 
         if not pr_number:
             return {"success": False, "error": "PR number not found"}
 
-        pr = repo.get_pull(pr_number)
-        review = pr.create_review(body=comment, event="REQUEST_CHANGES")
+        review = await self.client.post(
+            f"/repos/{repo_name}/pulls/{pr_number}/reviews",
+            json={"body": body, "event": event}
+        )
 
         return {
             "success": True,
-            "review_id": review.id,
-            "state": "CHANGES_REQUESTED"
+            "review_id": review["id"],
+            "state": review["state"]
         }
 
     async def _triage_issue(
@@ -184,25 +400,40 @@ class GitHubTool(BaseTool):
         input_data: Dict[str, Any],
         comment: str
     ) -> Dict[str, Any]:
-        """Triage an issue (add labels, comment, assign)"""
+        """
+        Triage an issue (add labels, comment, assign).
+
+        Labels and assignees come from input_data["triage"] when present.
+        The updates are independent, so they are sent concurrently and any
+        failures are reported per step.
+        """
         repo_name = self._get_repo_name(input_data)
         if not repo_name:
             return {"success": False, "error": "Repository not specified"}
 
-        repo = self.client.get_repo(repo_name)
         issue_number = input_data.get("issue", {}).get("number")
 
         if not issue_number:
             return {"success": False, "error": "Issue number not found"}
 
-        issue = repo.get_issue(issue_number)
-
-        # Add comment
-        issue.create_comment(comment)
+        triage = input_data.get("triage") or {}
+        issue_path = f"/repos/{repo_name}/issues/{issue_number}"
+
+        steps = {"comment": self.client.post(f"{issue_path}/comments", json={"body": comment})}
+        if triage.get("labels"):
+            steps["labels"] = self.client.post(
+                f"{issue_path}/labels",
+                json={"labels": triage["labels"]}
+            )
+        if triage.get("assignees"):
+            steps["assignees"] = self.client.post(
+                f"{issue_path}/assignees",
+                json={"assignees": triage["assignees"]}
+            )
 
         return {
-            "success": True,
-            "issue_number": issue_number
+            "issue_number": issue_number,
+            **await gather_steps(steps)
         }
 
     async def _add_label(
@@ -215,29 +446,42 @@ class GitHubTool(BaseTool):
         if not repo_name:
             return {"success": False, "error": "Repository not specified"}
 
-        repo = self.client.get_repo(repo_name)
-
-        if "pull_request" in input_data:
-            number = input_data["pull_request"]["number"]
-            item = repo.get_issue(number)  # PRs are issues in GitHub API
-        elif "issue" in input_data:
-            number = input_data["issue"]["number"]
-            item = repo.get_issue(number)
-        else:
+        number = self._get_item_number(input_data)
+        if not number:
             return {"success": False, "error": "No PR or issue in input"}
 
-        item.add_to_labels(label)
+        await self.client.post(
+            f"/repos/{repo_name}/issues/{number}/labels",
+            json={"labels": [label]}
+        )
 
         return {
             "success": True,
             "label": label
         }
 
+    # Action name -> handler; also the source of get_capabilities()
+    _ACTIONS: ClassVar[Dict[str, Callable[..., Awaitable[Dict[str, Any]]]]] = {
+        "comment": _add_comment,
+        "review_code": _review_pr,
+        "approve": _approve_pr,
+        "request_changes": _request_changes,
+        "triage": _triage_issue,
+        "add_label": _add_label,
+    }
+
+    def _get_item_number(self, input_data: Dict[str, Any]) -> Optional[int]:
+        """Extract the PR or issue number; PRs are issues in the GitHub API"""
+        if "pull_request" in input_data:
+            return input_data["pull_request"]["number"]
+        if "issue" in input_data:
+            return input_data["issue"]["number"]
+        return None
+
     def _get_repo_name(self, input_data: Dict[str, Any]) -> Optional[str]:
         """Extract repository name from input data"""
-        if "repository" in input_data:
-            return input_data["repository"].get("full_name")
-        return None
+        repository = input_data.get("repository")
+        return repository.get("full_name") if repository else None
 
     async def validate_credentials(self, credentials: Dict[str, str]) -> bool:
         """Validate GitHub credentials"""
@@ -246,49 +490,77 @@ class GitHubTool(BaseTool):
             if not token:
                 return False
 
-            client = Github(token)
-            user = client.get_user()
-            _ = user.login  # Trigger API call
+            if self._recently_validated(token):
+                return True
 
+            await GhClient.check_token(token)
+
+            self._mark_validated(token)
             return True
 
         except Exception as e:
-            logger.error(f"GitHub credential validation failed: {e}")
+            logger.error("GitHub credential validation failed", error=str(e))
             return False
 
     def get_capabilities(self) -> list:
         """Return GitHub capabilities"""
-        return [
-            "comment",
-            "review_code",
-            "approve",
-            "request_changes",
-            "triage",
-            "add_label"
-        ]
+        return list(self._ACTIONS)
 
     async def get_pr_diff(self, repo_name: str, pr_number: int) -> Optional[str]:
-        """Get the diff of a pull request"""
+        """
+        Get the diff of a pull request.
+
+        A burst of webhooks for one PR often asks for its diff at the same
+        time; concurrent callers wait on a single fetch.
+        """
         if not self.client:
             return None
 
-        try:
-            repo = self.client.get_repo(repo_name)
-            pr = repo.get_pull(pr_number)
-
-            # Get files changed
-            files = pr.get_files()
-            diff_parts = []
+        cache_key = (repo_name, pr_number)
+        cached = self._diff_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-            for file in files:
-                diff_parts.append(f"--- {file.filename}")
-                diff_parts.append(f"+++ {file.filename}")
-                if file.patch:
-                    diff_parts.append(file.patch)
-                diff_parts.append("")
+        return await self._inflight_diffs.run(
+            cache_key,
+            lambda: self._fetch_pr_diff(repo_name, pr_number)
+        )
 
-            return "\n".join(diff_parts)
+    async def _fetch_pr_diff(self, repo_name: str, pr_number: int) -> Optional[str]:
+        """Fetch a PR diff from GitHub and cache it"""
+        try:
+            try:
+                # GitHub renders the unified diff itself with the diff media type
+                response = await self.client.get_response(
+                    f"/repos/{repo_name}/pulls/{pr_number}",
+                    accept="application/vnd.github.v3.diff"
+                )
+                diff = response.text
+            except httpx.HTTPStatusError as e:
+                # Diffs over GitHub's size limits are refused with 406
+                if e.response.status_code != httpx.codes.NOT_ACCEPTABLE:
+                    raise
+                diff = await self._build_diff_from_files(repo_name, pr_number)
+
+            self._diff_cache.set((repo_name, pr_number), diff)
+            return diff
 
         except Exception as e:
-            logger.error(f"Failed to get PR diff: {e}")
+            logger.error("Failed to get PR diff", repo=repo_name, pr_number=pr_number, error=str(e))
             return None
+
+    async def _build_diff_from_files(self, repo_name: str, pr_number: int) -> str:
+        """Assemble a diff from the per-file patches of a PR"""
+        files = await self.client.get_all_pages(
+            f"/repos/{repo_name}/pulls/{pr_number}/files"
+        )
+        diff_parts = []
+
+        for file in files:
+            diff_parts.append(f"--- {file['filename']}")
+            diff_parts.append(f"+++ {file['filename']}")
+            if file.get("patch"):
+                diff_parts.append(file["patch"])
+            diff_parts.append("")
+
+        return "\n".join(diff_parts)
@@ -2,15 +2,32 @@
 Jira Tool - Handles Jira interactions
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, Optional
 import structlog
 from atlassian import Jira
 
 from src.config import settings
-from src.tools.base import BaseTool
+from src.tools.base import BaseTool, TTLCache, gather_steps
 
 logger = structlog.get_logger()
 
+# Bounded pool shared by all JiraTool instances for the blocking client
+_JIRA_MAX_WORKERS = 16
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=_JIRA_MAX_WORKERS,
+            thread_name_prefix="jira"
+        )
+    return _executor
+
 
 class JiraTool(BaseTool):
     """
@@ -37,6 +54,7 @@ class JiraTool(BaseTool):
         self.username = username
         self.api_token = api_token or settings.jira_api_token
         self.client = None
+        self._issue_cache = TTLCache(maxsize=512, ttl=60)
 
         if self.url and self.username and self.api_token:
             self.client = Jira(
@@ -56,29 +74,14 @@ class JiraTool(BaseTool):
             return {"success": False, "error": "Jira client not configured"}
 
         try:
-            if action == "comment" or action == "respond":
-                return await self._add_comment(input_data, response_text)
-
-            elif action == "update_status":
-                return await self._update_status(input_data, response_text)
-
-            elif action == "assign":
-                return await self._assign_issue(input_data, response_text)
-
-            elif action == "acknowledge":
-                return await self._acknowledge(input_data, response_text)
-
-            elif action == "triage_and_update":
-                return await self._triage(input_data, response_text)
-
-            elif action == "update_field":
-                return await self._update_field(input_data, response_text)
-
-            else:
+            handler = self._ACTIONS.get(action)
+            if handler is None:
                 return {"success": False, "error": f"Unknown action: {action}"}
 
+            return await handler(self, input_data, response_text)
+
         except Exception as e:
-            logger.error(f"Jira tool error: {e}")
+            logger.error("Jira tool error", action=action, error=str(e))
             return {"success": False, "error": str(e)}
 
     async def _add_comment(
@@ -91,7 +94,7 @@ class JiraTool(BaseTool):
         if not issue_key:
             return {"success": False, "error": "Issue key not found"}
 
-        self.client.issue_add_comment(issue_key, text)
+        await self._call(self.client.issue_add_comment, issue_key, text)
 
         return {
             "success": True,
@@ -109,7 +112,7 @@ class JiraTool(BaseTool):
             return {"success": False, "error": "Issue key not found"}
 
         # Get available transitions
-        transitions = self.client.get_issue_transitions(issue_key)
+        transitions = await self._call(self.client.get_issue_transitions, issue_key)
 
         # Find matching transition
         target_transition = None
@@ -126,7 +129,8 @@ class JiraTool(BaseTool):
             }
 
         # Execute transition
-        self.client.issue_transition(issue_key, target_transition["id"])
+        await self._call(self.client.issue_transition, issue_key, target_transition["id"])
+        self._issue_cache.discard(issue_key)
 
         return {
             "success": True,
@@ -144,7 +148,8 @@ class JiraTool(BaseTool):
         if not issue_key:
             return {"success": False, "error": "Issue key not found"}
 
-        self.client.assign_issue(issue_key, assignee)
+        await self._call(self.client.assign_issue, issue_key, assignee)
+        self._issue_cache.discard(issue_key)
 
         return {
             "success": True,
@@ -164,7 +169,7 @@ class JiraTool(BaseTool):
 
         # Add acknowledgment comment
         ack_comment = f"Acknowledged. {comment}"
-        self.client.issue_add_comment(issue_key, ack_comment)
+        await self._call(self.client.issue_add_comment, issue_key, ack_comment)
 
         return {
             "success": True,
@@ -177,21 +182,60 @@ class JiraTool(BaseTool):
         input_data: Dict[str, Any],
         analysis: str
     ) -> Dict[str, Any]:
-        """Triage an issue - analyze and update with findings"""
+        """
+        Triage an issue - analyze and update with findings.
+
+        Besides the analysis comment, input_data["triage"] may carry a
+        priority, labels and an assignee. The updates are sent concurrently
+        and failures are reported per step rather than aborting the rest.
+        """
         issue_key = self._get_issue_key(input_data)
         if not issue_key:
             return {"success": False, "error": "Issue key not found"}
 
+        triage = input_data.get("triage") or {}
+
         # Add triage comment
         triage_comment = f"**Triage Analysis:**\n\n{analysis}"
-        self.client.issue_add_comment(issue_key, triage_comment)
+        steps = {"comment": self._call(self.client.issue_add_comment, issue_key, triage_comment)}
+
+        if triage.get("priority"):
+            steps["priority"] = self._call(
+                self.client.update_issue_field,
+                issue_key,
+                {"priority": {"name": triage["priority"]}}
+            )
+        if triage.get("labels"):
+            # Add to the existing labels; setting the field would replace them
+            steps["labels"] = self._call(
+                self.client.edit_issue,
+                issue_key,
+                {"labels": [{"add": label} for label in triage["labels"]]}
+            )
+
+        if triage.get("assignee"):
+            steps["assignee"] = self._call(self.client.assign_issue, issue_key, triage["assignee"])
+
+        summary = await gather_steps(steps)
+        # Some steps may have landed even if others failed
+        self._issue_cache.discard(issue_key)
 
         return {
-            "success": True,
             "issue_key": issue_key,
-            "action": "triaged"
+            "action": "triaged",
+            **summary
         }
 
+    async def _call(self, method: Callable[..., Any], *args: Any) -> Any:
+        """
+        Invoke a Jira client method on the shared worker pool.
+
+        atlassian-python-api is synchronous, so calling it directly would
+        block the event loop for the whole HTTP round-trip.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), partial(method, *args))
+
     async def _update_field(
         self,
         input_data: Dict[str, Any],
@@ -208,10 +252,12 @@ class JiraTool(BaseTool):
 
         field_name, value = field_update.split(":", 1)
 
-        self.client.update_issue_field(
+        await self._call(
+            self.client.update_issue_field,
             issue_key,
             {field_name.strip(): value.strip()}
         )
+        self._issue_cache.discard(issue_key)
 
         return {
             "success": True,
@@ -220,6 +266,17 @@ class JiraTool(BaseTool):
             "value": value.strip()
         }
 
+    # Action name -> handler; also the source of get_capabilities()
+    _ACTIONS: ClassVar[Dict[str, Callable[..., Awaitable[Dict[str, Any]]]]] = {
+        "comment": _add_comment,
+        "respond": _add_comment,
+        "update_status": _update_status,
+        "assign": _assign_issue,
+        "acknowledge": _acknowledge,
+        "triage_and_update": _triage,
+        "update_field": _update_field,
+    }
+
     def _get_issue_key(self, input_data: Dict[str, Any]) -> Optional[str]:
         """Extract issue key from input data"""
         # Try direct key
@@ -248,36 +305,36 @@ class JiraTool(BaseTool):
             if not all([url, username, api_token]):
                 return False
 
+            if self._recently_validated(url, username, api_token):
+                return True
+
             client = Jira(url=url, username=username, password=api_token)
             # Try to get current user
-            client.myself()
+            await self._call(client.myself)
 
+            self._mark_validated(url, username, api_token)
             return True
 
         except Exception as e:
-            logger.error(f"Jira credential validation failed: {e}")
+            logger.error("Jira credential validation failed", error=str(e))
             return False
 
     def get_capabilities(self) -> list:
         """Return Jira capabilities"""
-        return [
-            "comment",
-            "respond",
-            "update_status",
-            "assign",
-            "acknowledge",
-            "triage_and_update",
-            "update_field"
-        ]
+        return list(self._ACTIONS)
 
     async def get_issue_details(self, issue_key: str) -> Optional[Dict[str, Any]]:
         """Get full details of an issue"""
         if not self.client:
             return None
 
+        cached = self._issue_cache.get(issue_key)
+        if cached is not None:
+            return cached
+
         try:
-            issue = self.client.issue(issue_key)
-            return {
+            issue = await self._call(self.client.issue, issue_key)
+            details = {
                 "key": issue["key"],
                 "summary": issue["fields"]["summary"],
                 "description": issue["fields"].get("description"),
@@ -288,6 +345,8 @@ class JiraTool(BaseTool):
                 "created": issue["fields"]["created"],
                 "updated": issue["fields"]["updated"]
             }
+            self._issue_cache.set(issue_key, details)
+            return details
         except Exception as e:
-            logger.error(f"Failed to get issue details: {e}")
+            logger.error("Failed to get issue details", issue_key=issue_key, error=str(e))
             return None
@@ -2,16 +2,31 @@
 Slack Tool - Handles Slack interactions
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, ClassVar, Dict, Optional
+from urllib.parse import urlsplit
+import aiohttp
+import httpx
 import structlog
 from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
 
 from src.config import settings
-from src.tools.base import BaseTool
+from src.tools.base import BaseTool, TTLCache, token_digest
 
 logger = structlog.get_logger()
 
+# Slack only issues interaction response_urls on this host
+_RESPONSE_URL_HOST = "hooks.slack.com"
+
+
+def _is_slack_response_url(url: str) -> bool:
+    """Whether url is an https URL on Slack's response_url host"""
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return False
+    return parts.scheme == "https" and parts.hostname == _RESPONSE_URL_HOST
+
 
 class SlackTool(BaseTool):
     """
@@ -27,9 +42,38 @@ class SlackTool(BaseTool):
     name = "slack"
     description = "Interact with Slack workspaces"
 
+    # Shared client for posting to interaction response_urls
+    _http: ClassVar[Optional[httpx.AsyncClient]] = None
+    # Web API clients per token, all on one pooled aiohttp session; without
+    # an injected session the SDK opens a new connection for every call
+    _session: ClassVar[Optional[aiohttp.ClientSession]] = None
+    # Token digest -> Web API client; bounded so departed installs age out
+    _clients: ClassVar[TTLCache] = TTLCache(maxsize=256, ttl=3600)
+
     def __init__(self, token: Optional[str] = None):
         self.token = token or settings.slack_bot_token
-        self.client = AsyncWebClient(token=self.token) if self.token else None
+        self.client = self._web_client(self.token) if self.token else None
+
+    @classmethod
+    def _shared_session(cls) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session, creating it on first use"""
+        if cls._session is None or cls._session.closed:
+            cls._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=30)
+            )
+            cls._clients.clear()
+        return cls._session
+
+    @classmethod
+    def _web_client(cls, token: str) -> AsyncWebClient:
+        """Return the cached Web API client for a token"""
+        session = cls._shared_session()
+        key = token_digest(token)
+        client = cls._clients.get(key)
+        if client is None:
+            client = AsyncWebClient(token=token, session=session)
+            cls._clients.set(key, client)
+        return client
 
     async def execute(
         self,
@@ -42,24 +86,18 @@ class SlackTool(BaseTool):
             return {"success": False, "error": "Slack client not configured"}
 
         try:
-            if action == "reply" or action == "respond":
-                return await self._send_message(input_data, response_text)
-
-            elif action == "react":
-                return await self._add_reaction(input_data, response_text)
-
-            elif action == "update":
-                return await self._update_message(input_data, response_text)
-
-            else:
+            handler = self._ACTIONS.get(action)
+            if handler is None:
                 return {"success": False, "error": f"Unknown action: {action}"}
 
+            return await handler(self, input_data, response_text)
+
         except SlackApiError as e:
-            logger.error(f"Slack API error: {e}")
+            logger.error("Slack API error", action=action, error=str(e))
             return {"success": False, "error": str(e)}
 
         except Exception as e:
-            logger.error(f"Slack tool error: {e}")
+            logger.error("Slack tool error", action=action, error=str(e))
             return {"success": False, "error": str(e)}
 
     async def _send_message(
@@ -67,10 +105,36 @@ class SlackTool(BaseTool):
         input_data: Dict[str, Any],
         text: str
     ) -> Dict[str, Any]:
-        """Send a message or reply in thread"""
+        """
+        Send a message or reply in thread.
+
+        Both delivery paths return success, channel, message_ts and via
+        ("response_url" or "web_api"). Slack doesn't report a timestamp
+        for response_url posts, so message_ts is None there, and channel
+        is None when the payload didn't name one.
+        """
         channel = input_data.get("channel") or input_data.get("channel_id")
         thread_ts = input_data.get("thread_ts") or input_data.get("ts")
 
+        # Slash commands and interactions come with a response_url, which
+        # skips the Web API rate limit tiers and the channel lookup
+        response_url = input_data.get("response_url")
+        if response_url and not _is_slack_response_url(response_url):
+            # Never POST agent output to an arbitrary payload-supplied URL
+            logger.warning("Ignoring non-Slack response_url")
+            response_url = None
+
+        if response_url:
+            try:
+                return await self._send_via_response_url(
+                    response_url, text, channel, thread_ts
+                )
+            except httpx.HTTPError as e:
+                # response_urls expire; fall back to the Web API when we can
+                logger.warning("Slack response_url failed", error=str(e))
+                if not channel:
+                    raise
+
         if not channel:
             return {"success": False, "error": "No channel specified"}
 
@@ -83,9 +147,52 @@ class SlackTool(BaseTool):
         return {
             "success": True,
             "message_ts": response["ts"],
-            "channel": response["channel"]
+            "channel": response["channel"],
+            "via": "web_api"
         }
 
+    async def _send_via_response_url(
+        self,
+        response_url: str,
+        text: str,
+        channel: Optional[str],
+        thread_ts: Optional[str]
+    ) -> Dict[str, Any]:
+        """Post a message to an interaction's response_url"""
+        # Without in_channel Slack shows the reply only to the invoking user,
+        # while chat.postMessage would have posted it to the channel
+        payload = {"text": text, "response_type": "in_channel", "replace_original": False}
+        if thread_ts:
+            payload["thread_ts"] = thread_ts
+
+        response = await self._response_client().post(response_url, json=payload)
+        response.raise_for_status()
+
+        return {
+            "success": True,
+            "message_ts": None,
+            "channel": channel,
+            "via": "response_url"
+        }
+
+    @classmethod
+    def _response_client(cls) -> httpx.AsyncClient:
+        """Return the shared response_url client, creating it on first use"""
+        if cls._http is None or cls._http.is_closed:
+            cls._http = httpx.AsyncClient(timeout=10.0)
+        return cls._http
+
+    @classmethod
+    async def aclose(cls):
+        """Close shared HTTP connections"""
+        if cls._http is not None:
+            await cls._http.aclose()
+            cls._http = None
+        if cls._session is not None:
+            await cls._session.close()
+            cls._session = None
+        cls._clients.clear()
+
     async def _add_reaction(
         self,
         input_data: Dict[str, Any],
@@ -132,6 +239,14 @@ class SlackTool(BaseTool):
             "message_ts": response["ts"]
         }
 
+    # Action name -> handler; also the source of get_capabilities()
+    _ACTIONS: ClassVar[Dict[str, Callable[..., Awaitable[Dict[str, Any]]]]] = {
+        "reply": _send_message,
+        "respond": _send_message,
+        "react": _add_reaction,
+        "update": _update_message,
+    }
+
     async def validate_credentials(self, credentials: Dict[str, str]) -> bool:
         """Validate Slack credentials"""
         try:
@@ -139,23 +254,29 @@ class SlackTool(BaseTool):
             if not token:
                 return False
 
-            client = AsyncWebClient(token=token)
+            if self._recently_validated(token):
+                return True
+
+            # A single bare auth.test: not added to the client cache, since
+            # the token may be about to be rejected, and not retried
+            client = AsyncWebClient(
+                token=token,
+                session=self._shared_session(),
+                retry_handlers=[]
+            )
             response = await client.auth_test()
 
+            if response["ok"]:
+                self._mark_validated(token)
             return response["ok"]
 
         except Exception as e:
-            logger.error(f"Slack credential validation failed: {e}")
+            logger.error("Slack credential validation failed", error=str(e))
             return False
 
     def get_capabilities(self) -> list:
         """Return Slack capabilities"""
-        return [
-            "reply",
-            "respond",
-            "react",
-            "update"
-        ]
+        return list(self._ACTIONS)
 
     async def get_user_info(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get information about a Slack user"""
@@ -167,7 +288,7 @@ class SlackTool(BaseTool):
             if response["ok"]:
                 return response["user"]
         except Exception as e:
-            logger.error(f"Failed to get user info: {e}")
+            logger.error("Failed to get user info", user_id=user_id, error=str(e))
 
         return None
 
@@ -188,6 +309,6 @@ class SlackTool(BaseTool):
             if response["ok"]:
                 return response["messages"]
         except Exception as e:
-            logger.error(f"Failed to get channel history: {e}")
+            logger.error("Failed to get channel history", channel=channel, error=str(e))
 
         return []
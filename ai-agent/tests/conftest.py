@@ -0,0 +1,14 @@
+"""Shared test configuration."""
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop, as the service does, when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
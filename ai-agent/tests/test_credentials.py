@@ -0,0 +1,96 @@
+"""Tests for the credentials client cache and request coalescing."""
+import asyncio
+from uuid import uuid4
+
+import httpx
+import pytest
+import pytest_asyncio
+from src.services.credentials import CredentialsClient, CredentialsUnavailableError
+
+
+@pytest_asyncio.fixture
+async def client():
+    """Create a credentials client whose backend fetch is counted."""
+    client = CredentialsClient()
+    client.fetch_count = 0
+
+    async def fake_fetch(org_id, provider):
+        client.fetch_count += 1
+        await asyncio.sleep(0.01)
+        return {"provider": provider}
+
+    client._fetch_credentials = fake_fetch
+    yield client
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fetch(client):
+    """Test that concurrent cache misses issue a single backend request."""
+    org_id = uuid4()
+    results = await asyncio.gather(*(
+        client.get_credentials(org_id, "slack") for _ in range(5)
+    ))
+    assert client.fetch_count == 1
+    assert all(result == {"provider": "slack"} for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cached_until_ttl_expires(client):
+    """Test that results are served from cache until their TTL passes."""
+    org_id = uuid4()
+    await client.get_credentials(org_id, "github")
+    await client.get_credentials(org_id, "github")
+    assert client.fetch_count == 1
+
+    await client.get_credentials(org_id, "jira", ttl=0)
+    await client.get_credentials(org_id, "jira", ttl=0)
+    assert client.fetch_count == 3
+
+
+@pytest.mark.asyncio
+async def test_joiner_survives_owner_cancellation(client):
+    """Test that cancelling the fetching caller doesn't cancel joiners."""
+    org_id = uuid4()
+    owner = asyncio.create_task(client.get_credentials(org_id, "slack"))
+    await asyncio.sleep(0)
+    joiner = asyncio.create_task(client.get_credentials(org_id, "slack"))
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    assert await joiner == {"provider": "slack"}
+    assert owner.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_backend_error_is_not_reported_as_missing():
+    """Test that a backend failure raises instead of looking like a 404."""
+    client = CredentialsClient()
+    await client._client.aclose()
+    statuses = iter([503, 404])
+    client._client = httpx.AsyncClient(
+        base_url="http://backend",
+        transport=httpx.MockTransport(lambda request: httpx.Response(next(statuses)))
+    )
+    org_id = uuid4()
+
+    with pytest.raises(CredentialsUnavailableError):
+        await client.get_credentials(org_id, "jira")
+    assert await client.get_credentials(org_id, "jira") is None
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_clear_cache_detaches_inflight_fetch(client):
+    """Test that callers after clear_cache don't reuse an older fetch."""
+    org_id = uuid4()
+    stale = asyncio.create_task(client.get_credentials(org_id, "slack"))
+    await asyncio.sleep(0)
+
+    client.clear_cache(org_id, "slack")
+    await client.get_credentials(org_id, "slack")
+    await stale
+    assert client.fetch_count == 2
+
+    await client.get_credentials(org_id, "slack")
+    assert client.fetch_count == 2
@@ -0,0 +1,146 @@
+"""Tests for the GitHub REST client and PR diff fetching."""
+import asyncio
+
+import httpx
+import pytest
+import pytest_asyncio
+from src.tools.github import GhClient, GitHubTool
+
+
+@pytest_asyncio.fixture
+async def github():
+    """Route the shared GitHub client through a mock transport."""
+    state = {"handler": None, "requests": []}
+
+    async def dispatch(request):
+        state["requests"].append(request)
+        return await state["handler"](request)
+
+    GhClient._http = httpx.AsyncClient(
+        base_url=GhClient.base_url,
+        transport=httpx.MockTransport(dispatch)
+    )
+    GhClient._shared_limiters.clear()
+    yield state
+    await GhClient.aclose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_diff_requests_share_one_fetch(github):
+    """Test that concurrent callers for one PR diff issue a single request."""
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, text="diff --git a/x b/x")
+
+    github["handler"] = handler
+    tool = GitHubTool(token="t")
+
+    diffs = await asyncio.gather(*(tool.get_pr_diff("o/r", 1) for _ in range(5)))
+    assert diffs == ["diff --git a/x b/x"] * 5
+    assert len(github["requests"]) == 1
+    assert github["requests"][0].headers["accept"] == "application/vnd.github.v3.diff"
+
+
+@pytest.mark.asyncio
+async def test_diff_joiner_survives_owner_cancellation(github):
+    """Test that cancelling the fetching caller doesn't cancel joiners."""
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, text="diff")
+
+    github["handler"] = handler
+    tool = GitHubTool(token="t")
+
+    owner = asyncio.create_task(tool.get_pr_diff("o/r", 1))
+    await asyncio.sleep(0)
+    joiner = asyncio.create_task(tool.get_pr_diff("o/r", 1))
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    assert await joiner == "diff"
+    assert owner.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_request_is_retried(github):
+    """Test that a 429 is retried after its Retry-After delay."""
+    statuses = iter([429, 200])
+
+    async def handler(request):
+        return httpx.Response(next(statuses), json={"ok": True}, headers={"retry-after": "0"})
+
+    github["handler"] = handler
+    assert await GhClient(["t"]).get("/repos/o/r") == {"ok": True}
+    assert len(github["requests"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_forbidden_is_only_retried_when_quota_is_exhausted(github):
+    """Test that a 403 is retried for an empty quota but raised otherwise."""
+    responses = iter([
+        httpx.Response(403, headers={"x-ratelimit-remaining": "0", "retry-after": "0"}),
+        httpx.Response(200, json=[]),
+        httpx.Response(403, json={"message": "Forbidden"}),
+    ])
+
+    async def handler(request):
+        return next(responses)
+
+    github["handler"] = handler
+    client = GhClient(["t"])
+    assert await client.get("/a") == []
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get("/b")
+    assert len(github["requests"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_get_all_pages_follows_last_link(github):
+    """Test that every page up to rel="last" is fetched and concatenated."""
+    async def handler(request):
+        page = int(request.url.params["page"])
+        headers = {}
+        if page == 1:
+            headers["link"] = (
+                '<https://api.github.com/items?per_page=2&page=2>; rel="next", '
+                '<https://api.github.com/items?per_page=2&page=3>; rel="last"'
+            )
+        return httpx.Response(200, json=[page * 10, page * 10 + 1], headers=headers)
+
+    github["handler"] = handler
+    items = await GhClient(["t"]).get_all_pages("/items", per_page=2)
+    assert items == [10, 11, 20, 21, 30, 31]
+    assert len(github["requests"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_not_modified_returns_cached_response(github):
+    """Test that a repeat read revalidates with the ETag under the same token."""
+    async def handler(request):
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"etag": '"v1"'})
+        return httpx.Response(200, json={"n": 1}, headers={"etag": '"v1"'})
+
+    github["handler"] = handler
+    client = GhClient(["t1", "t2"])
+    assert await client.get("/repos/o/r") == {"n": 1}
+    assert await client.get("/repos/o/r") == {"n": 1}
+
+    first, second = github["requests"]
+    assert "if-none-match" not in first.headers
+    assert second.headers["if-none-match"] == '"v1"'
+    assert second.headers["authorization"] == first.headers["authorization"]
+
+
+@pytest.mark.asyncio
+async def test_oversized_diff_falls_back_to_file_patches(github):
+    """Test that a 406 for the diff media type rebuilds it from the files."""
+    async def handler(request):
+        if request.url.path.endswith("/files"):
+            return httpx.Response(200, json=[{"filename": "a.py", "patch": "@@ -1 +1 @@"}])
+        return httpx.Response(406)
+
+    github["handler"] = handler
+    diff = await GitHubTool(token="t").get_pr_diff("o/r", 7)
+    assert diff == "--- a.py\n+++ a.py\n@@ -1 +1 @@\n"
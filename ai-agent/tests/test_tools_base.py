@@ -0,0 +1,91 @@
+"""Tests for the shared tool helpers."""
+import asyncio
+import time
+
+import pytest
+from src.tools.base import RateLimiter, TTLCache
+
+
+def test_ttl_cache_expires_entries():
+    """Test that entries are dropped once their TTL has passed."""
+    cache = TTLCache(ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=0)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test that a full cache evicts the entry read least recently."""
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_discard():
+    """Test that discard drops one entry and ignores missing keys."""
+    cache = TTLCache()
+    cache.set("a", 1)
+    cache.discard("a")
+    cache.discard("missing")
+    assert cache.get("a") is None
+
+
+def test_rate_limiter_update_reads_headers():
+    """Test that the quota is taken from the rate limit headers."""
+    limiter = RateLimiter()
+    limiter.update({
+        "x-ratelimit-limit": "5000",
+        "x-ratelimit-remaining": "400",
+        "x-ratelimit-reset": "1700000000"
+    })
+    assert limiter.limit == 5000
+    assert limiter.remaining == 400
+    assert limiter.reset_epoch == 1700000000.0
+    assert limiter.is_low()
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_passes_through_above_threshold(monkeypatch):
+    """Test that no delay is added while the quota is healthy."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr("src.tools.base.asyncio.sleep", fake_sleep)
+    limiter = RateLimiter(threshold=100)
+    limiter.update({"x-ratelimit-remaining": "4000"})
+
+    await limiter.acquire()
+    assert delays == []
+    assert limiter.remaining == 4000
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_staggers_concurrent_callers(monkeypatch):
+    """Test that each acquire reserves its own slot below the threshold."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr("src.tools.base.asyncio.sleep", fake_sleep)
+    limiter = RateLimiter(threshold=100)
+    limiter.update({
+        "x-ratelimit-remaining": "10",
+        "x-ratelimit-reset": str(time.time() + 10)
+    })
+
+    await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+
+    assert limiter.remaining == 6
+    assert len(delays) == 3
+    assert delays == sorted(delays)
+    assert delays[0] == pytest.approx(1.0, abs=0.1)
+    assert delays[2] - delays[1] == pytest.approx(delays[1] - delays[0], abs=0.2)
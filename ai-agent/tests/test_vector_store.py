@@ -0,0 +1,50 @@
+"""Tests for the vector store metadata filters."""
+import pytest
+from src.memory.vector_store import VectorStore
+
+
+@pytest.fixture
+def store():
+    """Create an in-memory vector store instance."""
+    return VectorStore()
+
+
+def test_filter_eq(store):
+    """Test that $eq and bare values match by equality."""
+    assert store._compile_filter({"type": {"$eq": "doc"}})({"type": "doc"})
+    assert not store._compile_filter({"type": {"$eq": "doc"}})({"type": "msg"})
+    assert store._compile_filter({"type": "doc"})({"type": "doc"})
+
+
+def test_filter_ne(store):
+    """Test that $ne rejects equal values."""
+    matches = store._compile_filter({"type": {"$ne": "doc"}})
+    assert matches({"type": "msg"})
+    assert not matches({"type": "doc"})
+
+
+def test_filter_in(store):
+    """Test that $in matches members of the operand list."""
+    matches = store._compile_filter({"source": {"$in": ["slack", "jira"]}})
+    assert matches({"source": "slack"})
+    assert not matches({"source": "github"})
+
+
+def test_filter_in_unhashable_metadata(store):
+    """Test that unhashable stored values are compared, not raised on."""
+    matches = store._compile_filter({"tags": {"$in": [["a", "b"], "c"]}})
+    assert matches({"tags": ["a", "b"]})
+    assert not matches({"tags": ["x"]})
+
+
+def test_filter_in_string_operand(store):
+    """Test that a string operand keeps substring semantics."""
+    matches = store._compile_filter({"channel": {"$in": "general-eng"}})
+    assert matches({"channel": "general"})
+    assert not matches({"channel": "random"})
+
+
+def test_filter_missing_key(store):
+    """Test that metadata without the filtered key never matches."""
+    matches = store._compile_filter({"type": {"$ne": "doc"}})
+    assert not matches({"other": "value"})